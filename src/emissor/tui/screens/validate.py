@@ -8,6 +8,29 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, RichLog, Static
 
 
+def _check_clients() -> list[str]:
+    """Load and parse every configured client, one status line per client."""
+    lines: list[str] = []
+    try:
+        from emissor.config import list_clients, load_client
+        from emissor.models.client import Client
+
+        clients = list_clients()
+        if clients:
+            for c in clients:
+                try:
+                    data = load_client(c)
+                    Client.from_dict(data)
+                    lines.append(f"[green]OK[/green] Cliente: {c}")
+                except Exception as ce:
+                    lines.append(f"[red]ERRO[/red] Cliente {c}: {ce}")
+        else:
+            lines.append("[yellow]AVISO[/yellow] Nenhum cliente configurado")
+    except Exception as e:
+        lines.append(f"[red]ERRO[/red] Clientes: {e}")
+    return lines
+
+
 class ValidateScreen(ModalScreen):
     """Certificate and config validation display."""
 
@@ -71,23 +94,7 @@ class ValidateScreen(ModalScreen):
             lines.append(f"[red]ERRO[/red] Certificado: {e}")
 
         # Clients
-        try:
-            from emissor.config import list_clients, load_client
-            from emissor.models.client import Client
-
-            clients = list_clients()
-            if clients:
-                for c in clients:
-                    try:
-                        data = load_client(c)
-                        Client.from_dict(data)
-                        lines.append(f"[green]OK[/green] Cliente: {c}")
-                    except Exception as ce:
-                        lines.append(f"[red]ERRO[/red] Cliente {c}: {ce}")
-            else:
-                lines.append("[yellow]AVISO[/yellow] Nenhum cliente configurado")
-        except Exception as e:
-            lines.append(f"[red]ERRO[/red] Clientes: {e}")
+        lines.extend(_check_clients())
 
         # API connectivity (ADN + SEFIN)
         env = self.app.env  # type: ignore[attr-defined]
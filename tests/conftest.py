@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 from cryptography import x509
@@ -14,6 +15,47 @@ from emissor.models.client import Client, Intermediary
 from emissor.models.emitter import Emitter
 from emissor.models.invoice import Invoice
 
+_TUI_DIR = (Path(__file__).parent / "test_tui").resolve()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tui",
+        action="store_true",
+        default=False,
+        help="also run the Textual TUI tests under tests/test_tui (slow)",
+    )
+
+
+def _names_tui_path(config) -> bool:
+    """Whether a command-line path points into tests/test_tui, e.g. one TUI module."""
+    for arg in config.args:
+        path = (config.invocation_params.dir / arg.split("::")[0]).resolve()
+        if path.is_relative_to(_TUI_DIR):
+            return True
+    return False
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Mark everything under tests/test_tui as ``tui`` and leave it out by default.
+
+    ``--tui`` runs the full suite; an explicit ``-m`` expression decides on its
+    own, so ``-m tui`` runs only the TUI tests. Naming a path under tests/test_tui
+    runs what it points at, so ``pytest tests/test_tui/test_query.py`` just works.
+    Runs before the ``-m`` filter so the mark it adds is already there to select on.
+    """
+    for item in items:
+        if item.path.is_relative_to(_TUI_DIR):
+            item.add_marker(pytest.mark.tui)
+    if config.getoption("--tui") or config.getoption("markexpr") or _names_tui_path(config):
+        return
+    selected = [item for item in items if item.get_closest_marker("tui") is None]
+    if len(selected) < len(items):
+        deselected = [item for item in items if item.get_closest_marker("tui") is not None]
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
 
 def xml_text(el: etree._Element, xpath: str) -> str | None:
     """Extract text from an XML element by xpath."""
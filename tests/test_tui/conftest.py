@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 
+from emissor.tui.app import EmissorApp
+from emissor.tui.screens.dashboard import DashboardScreen
 
-@pytest.fixture
-def mock_config():
+
+@contextmanager
+def _patch_config():
     """Patch config-dependent calls so the TUI can launch without real files."""
     emitter_dict = {
         "cnpj": "12345678000199",
@@ -20,6 +25,17 @@ def mock_config():
         "fone": "48999999999",
         "email": "contato@acme.com.br",
     }
+    client_dict = {
+        "nif": "123456789",
+        "nome": "Acme Corp",
+        "pais": "US",
+        "logradouro": "100 Main St",
+        "numero": "100",
+        "bairro": "n/a",
+        "cidade": "New York",
+        "estado": "NY",
+        "cep": "10001",
+    }
     with (
         patch("emissor.config.load_emitter", return_value=emitter_dict),
         patch("emissor.config.get_cert_path", return_value="/fake.pfx"),
@@ -36,11 +52,45 @@ def mock_config():
         ),
         patch("emissor.utils.sequence.peek_next_n_dps", return_value=5),
         patch("emissor.config.list_clients", return_value=["acme", "globex"]),
+        patch("emissor.config.load_client", return_value=client_dict),
         patch("emissor.config.migrate_data_layout"),
     ):
         yield
 
 
+@pytest.fixture
+def mock_config():
+    """Patch config-dependent calls so the TUI can launch without real files."""
+    with _patch_config():
+        yield
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_pilot():
+    """Boot one homologacao EmissorApp per module and yield its pilot.
+
+    Tests reach it through ``pilot``, which resets the app between them.
+    Starting Textual is the bulk of a TUI test's runtime. Modules that opt in
+    must run their tests on the module event loop (``loop_scope="module"``).
+    """
+    with _patch_config():
+        app = EmissorApp(env="homologacao")
+        # Nothing asserts on animations; skip them so pauses settle sooner
+        app.animation_level = "none"
+        async with app.run_test() as pilot:
+            yield pilot
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def pilot(shared_pilot):
+    """Lend the shared app to one test, then unwind it back to the dashboard."""
+    yield shared_pilot
+    app = shared_pilot.app
+    await app.workers.wait_for_complete()
+    while not isinstance(app.screen, DashboardScreen):
+        await app.pop_screen()
+
+
 @pytest.fixture
 def issued_dir_homol(tmp_path):
     """Create env-scoped issued dir for homologacao."""
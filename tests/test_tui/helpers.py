@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from textual.widgets import RichLog
+
+
+async def wait_until(pilot, predicate: Callable[[], object], timeout: float = 2.0) -> None:
+    """Pump the app one tick at a time until ``predicate()`` is truthy.
+
+    Returns as soon as the state a test is about to assert on is ready, instead
+    of pausing a whole idle cycle and hoping a thread worker has finished.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError(f"Condition not met within {timeout}s")
+        await pilot.pause(0)
+
+
+async def wait_for_screen(pilot, screen_type: type, timeout: float = 2.0) -> None:
+    """Wait until the app's active screen is an instance of ``screen_type``."""
+    await wait_until(pilot, lambda: isinstance(pilot.app.screen, screen_type), timeout)
+
+
+def log_text(log: RichLog) -> str:
+    """Return everything written to ``log`` as plain text, one line per row."""
+    return "\n".join(map(str, log.lines))
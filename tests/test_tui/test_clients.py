@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
-import pytest
 from textual.widgets import Button, DataTable, Input, Label, Select
 
 from emissor.tui.app import EmissorApp
@@ -10,7 +9,6 @@ from emissor.tui.screens.clients import ClientsScreen
 from emissor.tui.screens.dashboard import DashboardScreen
 
 
-@pytest.mark.asyncio
 async def test_clients_screen_opens_on_l(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -18,7 +16,6 @@ async def test_clients_screen_opens_on_l(mock_config):
         assert isinstance(app.screen, ClientsScreen)
 
 
-@pytest.mark.asyncio
 async def test_clients_screen_shows_list_phase(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -29,7 +26,6 @@ async def test_clients_screen_shows_list_phase(mock_config):
         assert screen.query_one("#client-form-container").display is False
 
 
-@pytest.mark.asyncio
 async def test_clients_table_populated(mock_config):
     client_data = {
         "acme": {"nome": "Acme Corp", "nif": "123", "pais": "US"},
@@ -48,7 +44,6 @@ async def test_clients_table_populated(mock_config):
             assert table.row_count == 2
 
 
-@pytest.mark.asyncio
 async def test_novo_cliente_switches_to_form(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -64,7 +59,6 @@ async def test_novo_cliente_switches_to_form(mock_config):
         assert screen.query_one("#client-slug", Input).disabled is False
 
 
-@pytest.mark.asyncio
 async def test_save_writes_yaml(mock_config, tmp_path):
     clients_dir = tmp_path / "clients"
     clients_dir.mkdir()
@@ -109,7 +103,6 @@ async def test_save_writes_yaml(mock_config, tmp_path):
             assert data["mec_af_comex_t"] == "04"
 
 
-@pytest.mark.asyncio
 async def test_edit_prefills_form(mock_config):
     client_data = {
         "acme": {
@@ -157,7 +150,6 @@ async def test_edit_prefills_form(mock_config):
             assert screen.query_one("#client-mec-af-comex-t", Select).value == "04"
 
 
-@pytest.mark.asyncio
 async def test_escape_form_goes_to_list(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -174,7 +166,6 @@ async def test_escape_form_goes_to_list(mock_config):
         assert screen._phase == "list"
 
 
-@pytest.mark.asyncio
 async def test_escape_list_closes(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -185,7 +176,6 @@ async def test_escape_list_closes(mock_config):
         assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_save_validation_errors(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -207,7 +197,6 @@ async def test_save_validation_errors(mock_config):
         assert "slug" in error_text.lower() or "obrigat" in error_text.lower()
 
 
-@pytest.mark.asyncio
 async def test_delete_from_list_requires_confirmation(mock_config):
     """First press sets confirmation state; file is not yet deleted."""
     client_data = {"acme": {"nome": "Acme Corp", "nif": "123", "pais": "US"}}
@@ -226,7 +215,6 @@ async def test_delete_from_list_requires_confirmation(mock_config):
             assert screen._confirm_delete == "acme"
 
 
-@pytest.mark.asyncio
 async def test_delete_from_list_executes(mock_config, tmp_path):
     """Second press deletes the YAML file."""
     clients_dir = tmp_path / "clients"
@@ -259,7 +247,6 @@ async def test_delete_from_list_executes(mock_config, tmp_path):
             assert not (clients_dir / "acme.yaml").exists()
 
 
-@pytest.mark.asyncio
 async def test_delete_button_hidden_for_new_client(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -273,7 +260,6 @@ async def test_delete_button_hidden_for_new_client(mock_config):
         assert screen.query_one("#btn-form-delete", Button).display is False
 
 
-@pytest.mark.asyncio
 async def test_delete_button_visible_for_edit(mock_config):
     client_data = {
         "acme": {
@@ -302,7 +288,6 @@ async def test_delete_button_visible_for_edit(mock_config):
             assert screen.query_one("#btn-form-delete", Button).display is True
 
 
-@pytest.mark.asyncio
 async def test_delete_empty_table_shows_warning(mock_config):
     """Clicking delete with empty table shows warning notification."""
     with patch("emissor.config.list_clients", return_value=[]):
@@ -322,7 +307,6 @@ async def test_delete_empty_table_shows_warning(mock_config):
             # Should not crash — just a warning notification
 
 
-@pytest.mark.asyncio
 async def test_save_error_shows_error_label(mock_config, tmp_path):
     """Save error in threaded worker shows error in label."""
     with (
@@ -360,7 +344,6 @@ async def test_save_error_shows_error_label(mock_config, tmp_path):
             assert "Erro" in error_text
 
 
-@pytest.mark.asyncio
 async def test_slug_uniqueness_new_client(mock_config, tmp_path):
     """New client with existing slug shows error."""
     with (
@@ -393,7 +376,6 @@ async def test_slug_uniqueness_new_client(mock_config, tmp_path):
             assert "existe" in error_text.lower() or "slug" in error_text.lower()
 
 
-@pytest.mark.asyncio
 async def test_load_client_error_shows_erro_row(mock_config):
     """Error loading a client shows 'erro' in the table."""
 
@@ -418,7 +400,6 @@ async def test_load_client_error_shows_erro_row(mock_config):
             assert table.row_count == 2
 
 
-@pytest.mark.asyncio
 async def test_form_delete_from_edit(mock_config, tmp_path):
     """Clicking delete button in form phase for an edit triggers delete flow."""
     client_data = {
@@ -467,7 +448,6 @@ async def test_form_delete_from_edit(mock_config, tmp_path):
             assert not (clients_dir / "acme.yaml").exists()
 
 
-@pytest.mark.asyncio
 async def test_close_button_pops_screen(mock_config):
     """Clicking close button pops the screen."""
     app = EmissorApp(env="homologacao")
@@ -482,7 +462,6 @@ async def test_close_button_pops_screen(mock_config):
         assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_modal_close_button_pops_screen(mock_config):
     """Clicking X button pops the screen."""
     app = EmissorApp(env="homologacao")
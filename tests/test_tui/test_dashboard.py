@@ -5,8 +5,6 @@ import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
-import pytest
-
 from emissor.tui.app import EmissorApp
 
 
@@ -18,7 +16,6 @@ def _patch_data(tmp_path):
 # --- Existing tests updated for new layout ---
 
 
-@pytest.mark.asyncio
 async def test_dashboard_shows_env_badge(mock_config):
     from textual.widgets import Button
 
@@ -29,7 +26,6 @@ async def test_dashboard_shows_env_badge(mock_config):
         assert "HOMOLOGA" in badge.label.plain
 
 
-@pytest.mark.asyncio
 async def test_dashboard_loads_emitter_info(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -39,7 +35,6 @@ async def test_dashboard_loads_emitter_info(mock_config):
         assert "ACME" in text
 
 
-@pytest.mark.asyncio
 async def test_dashboard_key_n_opens_new_invoice(mock_config):
     from emissor.tui.screens.new_invoice import NewInvoiceScreen
 
@@ -49,7 +44,6 @@ async def test_dashboard_key_n_opens_new_invoice(mock_config):
         assert isinstance(app.screen, NewInvoiceScreen)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_key_c_opens_query(mock_config):
     from emissor.tui.screens.query import QueryScreen
 
@@ -59,7 +53,6 @@ async def test_dashboard_key_c_opens_query(mock_config):
         assert isinstance(app.screen, QueryScreen)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_key_p_opens_download_pdf(mock_config):
     from emissor.tui.screens.download_pdf import DownloadPdfScreen
 
@@ -69,7 +62,6 @@ async def test_dashboard_key_p_opens_download_pdf(mock_config):
         assert isinstance(app.screen, DownloadPdfScreen)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_key_v_opens_validate(mock_config):
     from emissor.tui.screens.validate import ValidateScreen
 
@@ -79,7 +71,6 @@ async def test_dashboard_key_v_opens_validate(mock_config):
         assert isinstance(app.screen, ValidateScreen)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_vim_j_k_navigation(mock_config, tmp_path):
     """Pressing j/k moves the cursor in the recent invoices table."""
     from textual.widgets import DataTable
@@ -103,7 +94,6 @@ async def test_dashboard_vim_j_k_navigation(mock_config, tmp_path):
             assert table.cursor_coordinate.row == initial_row
 
 
-@pytest.mark.asyncio
 async def test_dashboard_enter_opens_query(mock_config, tmp_path):
     """Pressing Enter on an emitted invoice opens QueryScreen."""
     from textual.widgets import DataTable
@@ -124,7 +114,6 @@ async def test_dashboard_enter_opens_query(mock_config, tmp_path):
             assert isinstance(app.screen, QueryScreen)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_enter_dry_run_shows_notification(mock_config, tmp_path):
     """Pressing Enter on a dry_run entry shows a warning instead of opening query."""
     from textual.widgets import DataTable
@@ -149,7 +138,6 @@ async def test_dashboard_enter_dry_run_shows_notification(mock_config, tmp_path)
 # --- New tests ---
 
 
-@pytest.mark.asyncio
 async def test_env_toggle_reloads_table(mock_config, tmp_path):
     """Pressing 'e' shows confirmation; confirming toggles env and reloads table."""
     from textual.widgets import Button, DataTable
@@ -185,7 +173,6 @@ async def test_env_toggle_reloads_table(mock_config, tmp_path):
             assert table.row_count == 2
 
 
-@pytest.mark.asyncio
 async def test_env_toggle_cancel_stays_homologacao(mock_config, tmp_path):
     """Pressing 'e' then cancelling keeps env as homologacao."""
     from textual.widgets import Button
@@ -208,7 +195,6 @@ async def test_env_toggle_cancel_stays_homologacao(mock_config, tmp_path):
             assert app.env == "homologacao"
 
 
-@pytest.mark.asyncio
 async def test_filter_preset_hoje(mock_config, tmp_path):
     """The 'Hoje' filter only shows files modified today."""
     from textual.widgets import DataTable, Select
@@ -241,7 +227,6 @@ async def test_filter_preset_hoje(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_filter_preset_todos(mock_config, tmp_path):
     """The 'Todos' filter shows all files."""
     from textual.widgets import DataTable
@@ -260,7 +245,6 @@ async def test_filter_preset_todos(mock_config, tmp_path):
             assert table.row_count == 3
 
 
-@pytest.mark.asyncio
 async def test_filter_custom_date_range(mock_config, tmp_path):
     """Custom De/Ate date range filtering."""
     from textual.widgets import Button, DataTable, MaskedInput
@@ -298,7 +282,6 @@ async def test_filter_custom_date_range(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_data_migration(tmp_path):
     """migrate_data_layout moves old issued/*.xml to homologacao/issued/."""
     from emissor.config import migrate_data_layout
@@ -317,7 +300,6 @@ async def test_data_migration(tmp_path):
     assert not list(old_dir.glob("*.xml"))
 
 
-@pytest.mark.asyncio
 async def test_data_migration_skips_if_new_exists(tmp_path):
     """migrate_data_layout does not overwrite if new dir already exists."""
     old_dir = tmp_path / "issued"
@@ -339,7 +321,6 @@ async def test_data_migration_skips_if_new_exists(tmp_path):
     assert len(list(new_dir.glob("*.xml"))) == 1
 
 
-@pytest.mark.asyncio
 async def test_registry_invoices_shown(mock_config, tmp_path):
     """Registry invoices (both emitted and received) appear in the table."""
     import json
@@ -387,7 +368,6 @@ async def test_registry_invoices_shown(mock_config, tmp_path):
             assert table.row_count == 2
 
 
-@pytest.mark.asyncio
 async def test_clone_opens_prefilled_invoice(mock_config, tmp_path):
     """Pressing 'r' with a selected registry row opens NewInvoiceScreen with prefill."""
     import json
@@ -435,7 +415,6 @@ async def test_clone_opens_prefilled_invoice(mock_config, tmp_path):
 # --- Group 1: Covering remaining dashboard branches ---
 
 
-@pytest.mark.asyncio
 async def test_filter_preset_semana(mock_config, tmp_path):
     """The 'semana' preset shows only files from the last 7 days."""
     from textual.widgets import DataTable, Select
@@ -465,7 +444,6 @@ async def test_filter_preset_semana(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_filter_preset_mes(mock_config, tmp_path):
     """The 'mes' preset shows only files from the last 30 days."""
     from textual.widgets import DataTable, Select
@@ -495,7 +473,6 @@ async def test_filter_preset_mes(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_filter_tipo_recebida(mock_config, tmp_path):
     """Filtering by 'recebida' shows only received invoices."""
     import json
@@ -538,7 +515,6 @@ async def test_filter_tipo_recebida(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_filter_invalid_dates_graceful(mock_config, tmp_path):
     """Invalid date strings in De/Ate fields don't crash — filter proceeds."""
     from textual.widgets import Button, DataTable, MaskedInput
@@ -565,7 +541,6 @@ async def test_filter_invalid_dates_graceful(mock_config, tmp_path):
             assert isinstance(table.row_count, int)
 
 
-@pytest.mark.asyncio
 async def test_button_clone_no_selection(mock_config, tmp_path):
     """Clicking clone with no invoices shows a warning."""
     with _patch_data(tmp_path):
@@ -582,7 +557,6 @@ async def test_button_clone_no_selection(mock_config, tmp_path):
             assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_button_query_opens_query_screen(mock_config, tmp_path):
     """Clicking query button opens QueryScreen."""
     from emissor.tui.screens.query import QueryScreen
@@ -598,7 +572,6 @@ async def test_button_query_opens_query_screen(mock_config, tmp_path):
             assert isinstance(app.screen, QueryScreen)
 
 
-@pytest.mark.asyncio
 async def test_button_pdf_opens_download_screen(mock_config, tmp_path):
     """Clicking pdf button opens DownloadPdfScreen."""
     from emissor.tui.screens.download_pdf import DownloadPdfScreen
@@ -614,7 +587,6 @@ async def test_button_pdf_opens_download_screen(mock_config, tmp_path):
             assert isinstance(app.screen, DownloadPdfScreen)
 
 
-@pytest.mark.asyncio
 async def test_button_copy_no_selection(mock_config, tmp_path):
     """Clicking copy with no invoices does nothing (no crash)."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -630,7 +602,6 @@ async def test_button_copy_no_selection(mock_config, tmp_path):
             assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_sync_success(mock_config, tmp_path):
     """Manual sync with mocked iter_dfe registers documents."""
     import json
@@ -678,7 +649,6 @@ async def test_sync_success(mock_config, tmp_path):
                 assert "NFSe_sync_001" in chaves
 
 
-@pytest.mark.asyncio
 async def test_sync_error(mock_config, tmp_path):
     """Sync error shows notification, doesn't crash."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -705,7 +675,6 @@ async def test_sync_error(mock_config, tmp_path):
             assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_sync_key_error(mock_config, tmp_path):
     """Sync with missing cert config shows error notification."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -728,7 +697,6 @@ async def test_sync_key_error(mock_config, tmp_path):
             assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_clipboard_darwin(mock_config, tmp_path):
     """Clipboard copy on macOS uses pbcopy."""
     from textual.widgets import DataTable
@@ -755,7 +723,6 @@ async def test_clipboard_darwin(mock_config, tmp_path):
             assert mock_run.call_args[0][0] == ["pbcopy"]
 
 
-@pytest.mark.asyncio
 async def test_clipboard_linux_xclip(mock_config, tmp_path):
     """Clipboard copy on Linux with xclip available."""
     from textual.widgets import DataTable
@@ -786,7 +753,6 @@ async def test_clipboard_linux_xclip(mock_config, tmp_path):
             assert "xclip" in mock_run.call_args[0][0]
 
 
-@pytest.mark.asyncio
 async def test_clipboard_windows(mock_config, tmp_path):
     """Clipboard copy on Windows uses clip."""
     from textual.widgets import DataTable
@@ -813,7 +779,6 @@ async def test_clipboard_windows(mock_config, tmp_path):
             assert mock_run.call_args[0][0] == ["clip"]
 
 
-@pytest.mark.asyncio
 async def test_clipboard_unknown_platform(mock_config, tmp_path):
     """Clipboard copy on unknown platform shows fallback notification."""
     from textual.widgets import DataTable
@@ -838,7 +803,6 @@ async def test_clipboard_unknown_platform(mock_config, tmp_path):
             # Should not crash, shows fallback notification
 
 
-@pytest.mark.asyncio
 async def test_clipboard_file_not_found(mock_config, tmp_path):
     """Clipboard copy handles FileNotFoundError gracefully."""
     from textual.widgets import DataTable
@@ -865,7 +829,6 @@ async def test_clipboard_file_not_found(mock_config, tmp_path):
             await pilot.pause()
 
 
-@pytest.mark.asyncio
 async def test_clipboard_generic_error(mock_config, tmp_path):
     """Clipboard copy handles generic subprocess errors."""
     from textual.widgets import DataTable
@@ -892,7 +855,6 @@ async def test_clipboard_generic_error(mock_config, tmp_path):
             await pilot.pause()
 
 
-@pytest.mark.asyncio
 async def test_load_emitter_error(tmp_path):
     """Error loading emitter shows error in card."""
     with (
@@ -922,7 +884,6 @@ async def test_load_emitter_error(tmp_path):
             assert "Erro" in text or "erro" in text
 
 
-@pytest.mark.asyncio
 async def test_load_certificate_error(tmp_path):
     """Error loading certificate shows error in card."""
     with (
@@ -949,7 +910,6 @@ async def test_load_certificate_error(tmp_path):
             assert "erro" in text.lower()
 
 
-@pytest.mark.asyncio
 async def test_load_certificate_not_configured(tmp_path):
     """KeyError loading certificate shows 'não configurado'."""
     with (
@@ -972,7 +932,6 @@ async def test_load_certificate_not_configured(tmp_path):
             assert "configurado" in text.lower()
 
 
-@pytest.mark.asyncio
 async def test_load_sequence_error(tmp_path):
     """Error loading sequence shows error in card."""
     with (
@@ -1008,7 +967,6 @@ async def test_load_sequence_error(tmp_path):
             assert "erro" in text.lower()
 
 
-@pytest.mark.asyncio
 async def test_seen_keys_dedup(mock_config, tmp_path):
     """XML files already in registry are not duplicated in the table."""
     import json
@@ -1043,7 +1001,6 @@ async def test_seen_keys_dedup(mock_config, tmp_path):
             assert table.row_count == 1
 
 
-@pytest.mark.asyncio
 async def test_parse_date_empty_string(mock_config):
     """_parse_date with empty string returns now."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -1052,7 +1009,6 @@ async def test_parse_date_empty_string(mock_config):
     assert result.tzinfo is not None
 
 
-@pytest.mark.asyncio
 async def test_parse_date_invalid_string(mock_config):
     """_parse_date with invalid date returns now."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -1061,7 +1017,6 @@ async def test_parse_date_invalid_string(mock_config):
     assert result.tzinfo is not None
 
 
-@pytest.mark.asyncio
 async def test_parse_date_naive_datetime(mock_config):
     """_parse_date with naive datetime adds BRT timezone."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -1071,7 +1026,6 @@ async def test_parse_date_naive_datetime(mock_config):
     assert result.year == 2025
 
 
-@pytest.mark.asyncio
 async def test_parse_date_tz_aware_datetime(mock_config):
     """_parse_date with tz-aware datetime converts to BRT."""
     from emissor.tui.screens.dashboard import DashboardScreen
@@ -1081,7 +1035,6 @@ async def test_parse_date_tz_aware_datetime(mock_config):
     assert result.year == 2025
 
 
-@pytest.mark.asyncio
 async def test_env_toggle_from_producao(mock_config, tmp_path):
     """Toggling from producao goes directly to homologacao (no dialog)."""
     from textual.widgets import Button
@@ -1103,7 +1056,6 @@ async def test_env_toggle_from_producao(mock_config, tmp_path):
             assert "HOMOLOGA" in badge.label.plain
 
 
-@pytest.mark.asyncio
 async def test_action_focus_filter(mock_config, tmp_path):
     """action_focus_filter focuses the De input."""
     from textual.widgets import MaskedInput
@@ -1120,7 +1072,6 @@ async def test_action_focus_filter(mock_config, tmp_path):
             assert de_input.has_focus
 
 
-@pytest.mark.asyncio
 async def test_action_quit(mock_config, tmp_path):
     """action_quit exits the app."""
     with _patch_data(tmp_path):
@@ -1130,7 +1081,6 @@ async def test_action_quit(mock_config, tmp_path):
             await pilot.press("q")
 
 
-@pytest.mark.asyncio
 async def test_clone_entry_not_in_all_invoices(mock_config, tmp_path):
     """Clone with a selected stem that has no matching entry in _all_invoices."""
     from textual.widgets import DataTable
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import pytest
-
 from emissor.tui.app import EmissorApp
 from emissor.tui.screens.download_pdf import DownloadPdfScreen, _unique_path
 
 _VALID_CHAVE = "A" * 50
 
 
-@pytest.mark.asyncio
 async def test_download_pdf_screen_opens(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -16,7 +13,6 @@ async def test_download_pdf_screen_opens(mock_config):
         assert isinstance(app.screen, DownloadPdfScreen)
 
 
-@pytest.mark.asyncio
 async def test_download_pdf_pre_fills_chave(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -31,7 +27,6 @@ async def test_download_pdf_pre_fills_chave(mock_config):
         assert output_input.value == "nfse_key_456.pdf"
 
 
-@pytest.mark.asyncio
 async def test_download_pdf_escape_goes_back(mock_config):
     from emissor.tui.screens.dashboard import DashboardScreen
 
@@ -67,7 +62,6 @@ def test_unique_path_multiple_conflicts(tmp_path):
     assert result == tmp_path / "file_3.pdf"
 
 
-@pytest.mark.asyncio
 async def test_download_success(mock_config, tmp_path):
     """Successful download writes PDF file and shows success."""
     from unittest.mock import patch
@@ -100,7 +94,6 @@ async def test_download_success(mock_config, tmp_path):
             assert Path(output_path).read_bytes() == b"%PDF-fake-content"
 
 
-@pytest.mark.asyncio
 async def test_download_error(mock_config):
     """Download error shows error in label."""
     from unittest.mock import patch
@@ -124,7 +117,6 @@ async def test_download_error(mock_config):
             assert "Erro" in error.render().plain
 
 
-@pytest.mark.asyncio
 async def test_download_empty_chave_shows_error(mock_config):
     """Clicking Baixar with empty chave shows error."""
     from textual.widgets import Button, Label
@@ -141,7 +133,6 @@ async def test_download_empty_chave_shows_error(mock_config):
         assert "chave" in error.render().plain.lower()
 
 
-@pytest.mark.asyncio
 async def test_download_empty_output_uses_chave(mock_config, tmp_path):
     """When output is empty, defaults to {chave}.pdf."""
     from unittest.mock import patch
@@ -171,7 +162,6 @@ async def test_download_empty_output_uses_chave(mock_config, tmp_path):
             await pilot.pause()
 
 
-@pytest.mark.asyncio
 async def test_download_input_submitted(mock_config):
     """Pressing Enter in input triggers download."""
     from unittest.mock import patch
@@ -197,7 +187,6 @@ async def test_download_input_submitted(mock_config):
             assert "Erro" in error.render().plain
 
 
-@pytest.mark.asyncio
 async def test_download_close_button(mock_config):
     """Clicking close button pops screen."""
     from textual.widgets import Button
@@ -215,7 +204,6 @@ async def test_download_close_button(mock_config):
         assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_download_modal_close(mock_config):
     """Clicking X button pops screen."""
     from textual.widgets import Button
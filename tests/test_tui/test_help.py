@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-import pytest
-
 from emissor.tui.app import EmissorApp
 from emissor.tui.screens.dashboard import DashboardScreen
 from emissor.tui.screens.help import HelpScreen
 
 
-@pytest.mark.asyncio
 async def test_help_screen_opens(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -15,7 +12,6 @@ async def test_help_screen_opens(mock_config):
         assert isinstance(app.screen, HelpScreen)
 
 
-@pytest.mark.asyncio
 async def test_help_screen_closes_on_escape(mock_config):
     app = EmissorApp(env="homologacao")
     async with app.run_test() as pilot:
@@ -25,7 +21,6 @@ async def test_help_screen_closes_on_escape(mock_config):
         assert isinstance(app.screen, DashboardScreen)
 
 
-@pytest.mark.asyncio
 async def test_help_screen_closes_on_button(mock_config):
     from textual.widgets import Button
 
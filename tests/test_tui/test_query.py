@@ -1,172 +1,114 @@
 from __future__ import annotations
 
 import pytest
+from textual.widgets import Button, Input, Label, RichLog
 
-from emissor.tui.app import EmissorApp
+from emissor.services import adn_client
+from emissor.tui.screens.dashboard import DashboardScreen
 from emissor.tui.screens.query import QueryScreen
+from emissor.utils import registry
+from tests.test_tui.helpers import log_text, wait_for_screen, wait_until
 
-_VALID_CHAVE = "A" * 50
-
+# ``pilot`` lends out the app booted by the module-scoped ``shared_pilot``, so tests
+# must run on that fixture's module event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.mark.asyncio
-async def test_query_screen_opens(mock_config):
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("c")
-        assert isinstance(app.screen, QueryScreen)
+_VALID_CHAVE = "A" * 50
 
 
-@pytest.mark.asyncio
-async def test_query_pre_fills_chave(mock_config):
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        app.push_screen(QueryScreen(chave="test_key_123"))
-        await pilot.pause()
-        from textual.widgets import Input
+async def test_query_screen_opens(pilot):
+    app = pilot.app
+    await pilot.press("c")
+    assert isinstance(app.screen, QueryScreen)
 
-        input_widget = app.screen.query_one("#chave-input", Input)
-        assert input_widget.value == "test_key_123"
 
+async def test_query_pre_fills_chave(pilot):
+    app = pilot.app
+    app.push_screen(QueryScreen(chave="test_key_123"))
+    await pilot.pause()
+    input_widget = app.screen.query_one("#chave-input", Input)
+    assert input_widget.value == "test_key_123"
 
-@pytest.mark.asyncio
-async def test_query_escape_goes_back(mock_config):
-    from emissor.tui.screens.dashboard import DashboardScreen
 
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("c")
-        assert isinstance(app.screen, QueryScreen)
-        await pilot.press("escape")
-        assert isinstance(app.screen, DashboardScreen)
+async def test_query_escape_goes_back(pilot):
+    app = pilot.app
+    await app.push_screen(QueryScreen())
+    await pilot.press("escape")
+    await wait_for_screen(pilot, DashboardScreen)
 
 
-@pytest.mark.asyncio
-async def test_query_empty_input_shows_error(mock_config):
+async def test_query_empty_input_shows_error(pilot):
     """Clicking Consultar with empty chave shows an error label."""
-    from textual.widgets import Button, Label
+    app = pilot.app
+    app.push_screen(QueryScreen(chave=""))
+    await pilot.pause()
+    app.screen.query_one("#btn-consultar", Button).press()
+    await pilot.pause()
+    error = app.screen.query_one("#error-label", Label)
+    assert "chave" in str(error.content).lower()
 
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        app.push_screen(QueryScreen(chave=""))
-        await pilot.pause()
-        app.screen.query_one("#btn-consultar", Button).press()
-        await pilot.pause()
-        error = app.screen.query_one("#error-label", Label)
-        assert "chave" in error.render().plain.lower()  # type: ignore[union-attr]
 
+def _failing_query(msg: str):
+    def query_nfse(*args, **kwargs):
+        raise RuntimeError(msg)
 
-@pytest.mark.asyncio
-async def test_query_success(mock_config):
-    """Successful query displays result in RichLog."""
-    from unittest.mock import patch
+    return query_nfse
 
-    from textual.widgets import Button, RichLog
 
+async def test_query_success(pilot, monkeypatch):
+    """Successful query displays result in RichLog."""
     mock_result = {"chave": _VALID_CHAVE, "n_nfse": "99", "valor": "5000.00"}
+    monkeypatch.setattr(adn_client, "query_nfse", lambda *a, **k: mock_result)
+    monkeypatch.setattr(
+        registry, "find_invoice", lambda *a, **k: {"nsu": 10, "chave": _VALID_CHAVE}
+    )
 
-    with (
-        patch("emissor.services.adn_client.query_nfse", return_value=mock_result),
-        patch(
-            "emissor.utils.registry.find_invoice",
-            return_value={"nsu": 10, "chave": _VALID_CHAVE},
-        ),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            app.push_screen(QueryScreen(chave=_VALID_CHAVE))
-            await pilot.pause()
-
-            app.screen.query_one("#btn-consultar", Button).press()
-            await pilot.pause()
-            await pilot.pause()
-
-            log = app.screen.query_one("#query-result", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert _VALID_CHAVE in text
-
-
-@pytest.mark.asyncio
-async def test_query_error(mock_config):
-    """Query error shows error in label."""
-    from unittest.mock import patch
-
-    from textual.widgets import Button, Label
-
-    with patch(
-        "emissor.services.adn_client.query_nfse",
-        side_effect=RuntimeError("NFS-e não encontrada"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            app.push_screen(QueryScreen(chave=_VALID_CHAVE))
-            await pilot.pause()
-
-            app.screen.query_one("#btn-consultar", Button).press()
-            await pilot.pause()
-            await pilot.pause()
+    app = pilot.app
+    screen = QueryScreen(chave=_VALID_CHAVE)
+    await app.push_screen(screen)
 
-            error = app.screen.query_one("#error-label", Label)
-            assert "Erro" in error.render().plain
+    log = screen.query_one("#query-result", RichLog)
+    screen._do_query()
+    await wait_until(pilot, lambda: log.lines)
 
+    text = log_text(log)
+    assert _VALID_CHAVE in text
 
-@pytest.mark.asyncio
-async def test_query_input_submitted(mock_config):
-    """Pressing Enter in input triggers query."""
-    from unittest.mock import patch
-
-    from textual.widgets import Input, Label
-
-    with patch(
-        "emissor.services.adn_client.query_nfse",
-        side_effect=RuntimeError("not found"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            app.push_screen(QueryScreen(chave=_VALID_CHAVE))
-            await pilot.pause()
-
-            inp = app.screen.query_one("#chave-input", Input)
-            inp.focus()
-            await pilot.press("enter")
-            await pilot.pause()
-            await pilot.pause()
-
-            error = app.screen.query_one("#error-label", Label)
-            assert "Erro" in error.render().plain
 
+async def test_query_error(pilot, monkeypatch):
+    """Query error shows error in label."""
+    monkeypatch.setattr(adn_client, "query_nfse", _failing_query("NFS-e não encontrada"))
 
-@pytest.mark.asyncio
-async def test_query_close_button(mock_config):
-    """Clicking close button pops screen."""
-    from textual.widgets import Button
-
-    from emissor.tui.screens.dashboard import DashboardScreen
-
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        app.push_screen(QueryScreen(chave="test"))
-        await pilot.pause()
+    app = pilot.app
+    screen = QueryScreen(chave=_VALID_CHAVE)
+    await app.push_screen(screen)
 
-        app.screen.query_one("#btn-voltar", Button).press()
-        await pilot.pause()
+    error = screen.query_one("#error-label", Label)
+    screen._do_query()
+    await wait_until(pilot, lambda: "Erro" in str(error.content))
 
-        assert isinstance(app.screen, DashboardScreen)
 
+async def test_query_input_submitted(pilot, monkeypatch):
+    """Pressing Enter in input triggers query."""
+    monkeypatch.setattr(adn_client, "query_nfse", _failing_query("not found"))
 
-@pytest.mark.asyncio
-async def test_query_modal_close_button(mock_config):
-    """Clicking X button pops screen."""
-    from textual.widgets import Button
+    app = pilot.app
+    app.push_screen(QueryScreen(chave=_VALID_CHAVE))
+    await pilot.pause()
 
-    from emissor.tui.screens.dashboard import DashboardScreen
+    inp = app.screen.query_one("#chave-input", Input)
+    inp.focus()
+    error = app.screen.query_one("#error-label", Label)
+    await pilot.press("enter")
+    await wait_until(pilot, lambda: "Erro" in str(error.content))
 
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        app.push_screen(QueryScreen(chave="test"))
-        await pilot.pause()
 
-        app.screen.query_one("#btn-modal-close", Button).press()
-        await pilot.pause()
+@pytest.mark.parametrize("button_id", ["#btn-voltar", "#btn-modal-close"])
+async def test_query_close_buttons(pilot, button_id):
+    """Both Voltar and the X button pop the screen."""
+    app = pilot.app
+    app.push_screen(QueryScreen(chave="test"))
+    await pilot.pause()
 
-        assert isinstance(app.screen, DashboardScreen)
+    app.screen.query_one(button_id, Button).press()
+    await wait_for_screen(pilot, DashboardScreen)
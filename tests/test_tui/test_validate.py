@@ -1,295 +1,148 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
 from unittest.mock import patch
 
 import pytest
+from textual.widgets import Button, RichLog
 
-from emissor.tui.app import EmissorApp
 from emissor.tui.screens.dashboard import DashboardScreen
 from emissor.tui.screens.validate import ValidateScreen
+from tests.test_tui.helpers import log_text, wait_for_screen, wait_until
 
+# ``pilot`` lends out the app booted by the module-scoped ``shared_pilot``, so tests
+# must run on that fixture's module event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.mark.asyncio
-async def test_validate_screen_opens(mock_config):
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("v")
-        assert isinstance(app.screen, ValidateScreen)
 
+@pytest.fixture(autouse=True, scope="module")
+def stub_connectivity():
+    """Stub the ADN and SEFIN connectivity checks for every test in the module.
 
-@pytest.mark.asyncio
-async def test_validate_screen_closes_on_escape(mock_config):
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("v")
-        assert isinstance(app.screen, ValidateScreen)
-        await pilot.press("escape")
-        assert isinstance(app.screen, DashboardScreen)
-
-
-@pytest.mark.asyncio
-async def test_validate_screen_closes_on_button(mock_config):
-    from textual.widgets import Button
-
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("v")
-        assert isinstance(app.screen, ValidateScreen)
-        app.screen.query_one("#btn-voltar", Button).press()
-        await pilot.pause()
-        assert isinstance(app.screen, DashboardScreen)
-
-
-@pytest.mark.asyncio
-async def test_validate_connectivity_success(mock_config):
-    """Mocked connectivity success shows OK in output."""
-    from textual.widgets import RichLog
-
+    ValidateScreen runs them on mount, so even tests that only open and close the
+    screen would otherwise reach the network. Tests that need a failing check
+    patch it again inside their body.
+    """
     with (
         patch("emissor.services.adn_client.check_connectivity"),
         patch("emissor.services.sefin_client.check_sefin_connectivity"),
     ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            # Wait for the threaded worker to complete
-            await pilot.pause()
-            await pilot.pause()
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "Conectividade ADN" in text
+        yield
 
 
-@pytest.mark.asyncio
-async def test_validate_connectivity_error(mock_config):
-    """Mocked connectivity failure shows ERRO in output."""
-    from textual.widgets import RichLog
-
-    with (
-        patch(
-            "emissor.services.adn_client.check_connectivity",
-            side_effect=RuntimeError("Connection refused"),
-        ),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "ERRO" in text
-            assert "Conectividade ADN" in text
+async def test_validate_screen_opens(pilot):
+    app = pilot.app
+    await pilot.press("v")
+    assert isinstance(app.screen, ValidateScreen)
 
 
-@pytest.mark.asyncio
-async def test_validate_cert_not_configured(mock_config):
-    """Missing cert env vars shows ERRO for certificate."""
-    from textual.widgets import RichLog
-
-    with (
-        patch("emissor.config.get_cert_path", side_effect=KeyError("CERT_PFX_PATH")),
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "ERRO" in text
-            assert "não configurado" in text or "emissor-nacional init" in text
+async def test_validate_screen_closes_on_escape(pilot):
+    app = pilot.app
+    await app.push_screen(ValidateScreen())
+    await pilot.press("escape")
+    await wait_for_screen(pilot, DashboardScreen)
 
 
-@pytest.mark.asyncio
-async def test_validate_client_with_error(mock_config):
-    """Invalid client data shows ERRO in validation output."""
-    from textual.widgets import RichLog
+@pytest.mark.parametrize("button_id", ["#btn-voltar", "#btn-modal-close"])
+async def test_validate_screen_closes_on_button(pilot, button_id):
+    """Both Voltar and the X button pop the screen."""
+    app = pilot.app
+    await app.push_screen(ValidateScreen())
+    app.screen.query_one(button_id, Button).press()
+    await wait_for_screen(pilot, DashboardScreen)
 
-    def mock_load(name):
-        if name == "bad-client":
-            raise RuntimeError("Invalid YAML")
-        return {
-            "nif": "123",
-            "nome": "Good",
-            "pais": "US",
-            "logradouro": "St",
-            "numero": "1",
-            "bairro": "n/a",
-            "cidade": "NYC",
-            "estado": "NY",
-            "cep": "10001",
-        }
 
-    with (
-        patch("emissor.config.list_clients", return_value=["good-client", "bad-client"]),
-        patch("emissor.config.load_client", side_effect=mock_load),
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "ERRO" in text
-            assert "bad-client" in text
+async def test_validate_connectivity_success(pilot):
+    """Mocked connectivity success shows OK in output."""
+    app = pilot.app
+    await app.push_screen(ValidateScreen())
+    log = app.screen.query_one("#validation-output", RichLog)
+    await wait_until(pilot, lambda: log.lines)
+    text = log_text(log)
+    assert "Conectividade ADN" in text
 
 
-@pytest.mark.asyncio
-async def test_validate_no_clients_warning(mock_config):
+async def test_validate_no_clients_warning(pilot):
     """No clients configured shows AVISO."""
-    from textual.widgets import RichLog
-
-    with (
-        patch("emissor.config.list_clients", return_value=[]),
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "AVISO" in text or "Nenhum" in text
+    with patch("emissor.config.list_clients", return_value=[]):
+        app = pilot.app
+        await app.push_screen(ValidateScreen())
+        log = app.screen.query_one("#validation-output", RichLog)
+        await wait_until(pilot, lambda: log.lines)
+        text = log_text(log)
+        assert "AVISO" in text or "Nenhum" in text
 
 
-@pytest.mark.asyncio
-async def test_validate_all_ok_notification(mock_config):
+async def test_validate_all_ok_notification(pilot, client_dict):
     """When everything is OK, notification says 'tudo OK'."""
-    from textual.widgets import RichLog
-
-    def mock_load(name):
-        return {
-            "nif": "123",
-            "nome": "Good",
-            "pais": "US",
-            "logradouro": "St",
-            "numero": "1",
-            "bairro": "n/a",
-            "cidade": "NYC",
-            "estado": "NY",
-            "cep": "10001",
-        }
-
-    with (
-        patch("emissor.config.load_client", side_effect=mock_load),
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            # All checks should be OK, no ERRO
-            assert "OK" in text
-            assert "ERRO" not in text
-
-
-@pytest.mark.asyncio
-async def test_validate_modal_close_button(mock_config):
-    """Clicking X button pops screen."""
-    from textual.widgets import Button
-
-    app = EmissorApp(env="homologacao")
-    async with app.run_test() as pilot:
-        await pilot.press("v")
-        assert isinstance(app.screen, ValidateScreen)
-        app.screen.query_one("#btn-modal-close", Button).press()
-        await pilot.pause()
-        assert isinstance(app.screen, DashboardScreen)
-
-
-@pytest.mark.asyncio
-async def test_validate_emitter_error(mock_config):
-    """Emitter config error shows ERRO in output."""
-    from textual.widgets import RichLog
-
-    with (
-        patch(
-            "emissor.config.load_emitter",
-            side_effect=RuntimeError("emitter.yaml not found"),
-        ),
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "ERRO" in text
-            assert "Emitente" in text
-
-
-@pytest.mark.asyncio
-async def test_validate_sefin_success(mock_config):
+    with patch("emissor.config.load_client", return_value=client_dict):
+        app = pilot.app
+        await app.push_screen(ValidateScreen())
+        log = app.screen.query_one("#validation-output", RichLog)
+        await wait_until(pilot, lambda: log.lines)
+        text = log_text(log)
+        # All checks should be OK, no ERRO
+        assert "OK" in text
+        assert "ERRO" not in text
+
+
+async def test_validate_sefin_success(pilot):
     """Mocked SEFIN connectivity success shows OK in output."""
-    from textual.widgets import RichLog
-
-    with (
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch("emissor.services.sefin_client.check_sefin_connectivity"),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "Conectividade SEFIN" in text
-            assert "OK" in text
-
-
-@pytest.mark.asyncio
-async def test_validate_sefin_error(mock_config):
-    """Mocked SEFIN connectivity failure shows ERRO in output."""
-    from textual.widgets import RichLog
-
-    with (
-        patch("emissor.services.adn_client.check_connectivity"),
-        patch(
-            "emissor.services.sefin_client.check_sefin_connectivity",
-            side_effect=RuntimeError("Connection refused"),
+    app = pilot.app
+    await app.push_screen(ValidateScreen())
+    log = app.screen.query_one("#validation-output", RichLog)
+    await wait_until(pilot, lambda: log.lines)
+    text = log_text(log)
+    assert "Conectividade SEFIN" in text
+    assert "OK" in text
+
+
+@pytest.mark.parametrize(
+    ("patches", "expected_tag"),
+    [
+        (
+            [
+                (
+                    "emissor.services.adn_client.check_connectivity",
+                    {"side_effect": RuntimeError("Connection refused")},
+                )
+            ],
+            "Conectividade ADN",
         ),
-    ):
-        app = EmissorApp(env="homologacao")
-        async with app.run_test() as pilot:
-            await pilot.press("v")
-            await pilot.pause()
-            await pilot.pause()
-            await pilot.pause()
-            log = app.screen.query_one("#validation-output", RichLog)
-            lines = [str(line) for line in log.lines]
-            text = "\n".join(lines)
-            assert "ERRO" in text
-            assert "Conectividade SEFIN" in text
+        (
+            [
+                (
+                    "emissor.services.sefin_client.check_sefin_connectivity",
+                    {"side_effect": RuntimeError("Connection refused")},
+                )
+            ],
+            "Conectividade SEFIN",
+        ),
+        (
+            [("emissor.config.get_cert_path", {"side_effect": KeyError("CERT_PFX_PATH")})],
+            "Certificado não configurado",
+        ),
+        (
+            [
+                (
+                    "emissor.config.load_emitter",
+                    {"side_effect": RuntimeError("emitter.yaml not found")},
+                )
+            ],
+            "Emitente",
+        ),
+    ],
+    ids=["adn", "sefin", "cert", "emitter"],
+)
+async def test_validate_reports_error(pilot, patches, expected_tag):
+    """A failing check shows ERRO next to its own label in the output."""
+    with ExitStack() as stack:
+        for target, kwargs in patches:
+            stack.enter_context(patch(target, **kwargs))
+        app = pilot.app
+        await app.push_screen(ValidateScreen())
+        log = app.screen.query_one("#validation-output", RichLog)
+        await wait_until(pilot, lambda: log.lines)
+        text = log_text(log)
+        assert "ERRO" in text
+        assert expected_tag in text
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from emissor.tui.screens.validate import _check_clients
+
+
+def test_check_clients_reports_bad_client(client_dict):
+    """A client that fails to load is reported as ERRO without failing the others."""
+
+    def load_client(name):
+        if name == "bad-client":
+            raise RuntimeError("Invalid YAML")
+        return client_dict
+
+    with (
+        patch("emissor.config.list_clients", return_value=["good-client", "bad-client"]),
+        patch("emissor.config.load_client", side_effect=load_client),
+    ):
+        lines = _check_clients()
+    assert lines[0] == "[green]OK[/green] Cliente: good-client"
+    assert lines[1].startswith("[red]ERRO[/red] Cliente bad-client")
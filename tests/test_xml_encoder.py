@@ -3,16 +3,22 @@ from __future__ import annotations
 import base64
 import gzip
 
+import pytest
 from lxml import etree
 
 from emissor.services.xml_encoder import encode_dps
 
 
-def test_encode_roundtrip():
+@pytest.fixture(scope="module")
+def small_dps():
+    """A tiny element; encode_dps only serializes it, so one copy serves every test."""
     root = etree.Element("test")
     root.text = "hello world"
+    return root
 
-    encoded = encode_dps(root)
+
+def test_encode_roundtrip(small_dps):
+    encoded = encode_dps(small_dps)
 
     # Should be valid base64
     decoded = base64.b64decode(encoded)
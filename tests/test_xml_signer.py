@@ -1,72 +1,98 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+import copy
+from unittest.mock import MagicMock
 
 import pytest
 from lxml import etree
 
 from emissor.services.xml_signer import sign_dps
 
+_DS_NS = "http://www.w3.org/2000/09/xmldsig#"
+_SIGNATURE = etree.QName(_DS_NS, "Signature")
+
+_DPS_ID = "DPS420540721234567800019900900000000000000099"
+_REFERENCE_URI = f"#{_DPS_ID}"
+
+# Nothing here looks elements up by ID or needs entities, so skip both on parse
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+_DPS_TEMPLATE = etree.fromstring(
+    b'<DPS versao="1.00"><infDPS Id=""><tpAmb>2</tpAmb><serie>900</serie></infDPS></DPS>',
+    _PARSER,
+)
+
+# sign_dps rejects these before touching them, so every test can share one copy
+_DPS_WITHOUT_INF = etree.fromstring(b"<DPS/>", _PARSER)
+_DPS_WITHOUT_ID = etree.fromstring(b"<DPS><infDPS/></DPS>", _PARSER)
+
 
 def _make_dps(dps_id: str = "DPS420540721234567800019900900000000000000001") -> etree._Element:
-    """Build a minimal DPS element for signing tests."""
-    dps = etree.Element("DPS")
-    dps.set("versao", "1.00")
-    inf = etree.SubElement(dps, "infDPS")
-    inf.set("Id", dps_id)
-    etree.SubElement(inf, "tpAmb").text = "2"
-    etree.SubElement(inf, "serie").text = "900"
+    """Copy the minimal DPS template and stamp it with ``dps_id``."""
+    dps = copy.deepcopy(_DPS_TEMPLATE)
+    dps[0].set("Id", dps_id)
     return dps
 
 
-class TestSignDps:
-    @patch("emissor.services.xml_signer.XMLSigner")
-    def test_adds_signature(self, mock_signer_cls, self_signed_pem):
-        key_pem, cert_pem = self_signed_pem
-        dps = _make_dps()
-        # Make mock signer return element with a Signature child
-        signed_el = etree.Element("DPS")
-        etree.SubElement(signed_el, "infDPS").set("Id", "DPS1")
-        etree.SubElement(signed_el, "{http://www.w3.org/2000/09/xmldsig#}Signature")
-        mock_signer_cls.return_value.sign.return_value = signed_el
-
-        result = sign_dps(dps, key_pem, cert_pem)
-        sig = result.find("{http://www.w3.org/2000/09/xmldsig#}Signature")
-        assert sig is not None
-
-    @patch("emissor.services.xml_signer.XMLSigner")
-    def test_reference_uri_matches_id(self, mock_signer_cls, self_signed_pem):
-        key_pem, cert_pem = self_signed_pem
-        dps_id = "DPS420540721234567800019900900000000000000099"
-        dps = _make_dps(dps_id)
-        mock_signer_cls.return_value.sign.return_value = dps
-
-        sign_dps(dps, key_pem, cert_pem)
-        _, kwargs = mock_signer_cls.return_value.sign.call_args
-        assert kwargs["reference_uri"] == f"#{dps_id}"
-
-    @patch("emissor.services.xml_signer.XMLSigner")
-    def test_preserves_content(self, mock_signer_cls, self_signed_pem):
-        key_pem, cert_pem = self_signed_pem
-        dps = _make_dps()
-        # Return the same element (signer preserves content)
-        mock_signer_cls.return_value.sign.return_value = dps
-
-        result = sign_dps(dps, key_pem, cert_pem)
-        inf = result.find("infDPS")
-        assert inf is not None
-        tp_amb = inf.find("tpAmb")
-        assert tp_amb is not None and tp_amb.text == "2"
-
-    def test_raises_no_inf_dps(self, self_signed_pem):
-        key_pem, cert_pem = self_signed_pem
-        dps = etree.Element("DPS")
-        with pytest.raises(ValueError, match="infDPS element not found"):
-            sign_dps(dps, key_pem, cert_pem)
-
-    def test_raises_no_id(self, self_signed_pem):
-        key_pem, cert_pem = self_signed_pem
-        dps = etree.Element("DPS")
-        etree.SubElement(dps, "infDPS")  # no Id attribute
-        with pytest.raises(ValueError, match="missing Id attribute"):
-            sign_dps(dps, key_pem, cert_pem)
+@pytest.fixture(autouse=True)
+def mock_signer(monkeypatch):
+    """Replace XMLSigner for every test and return the signer sign_dps will build."""
+    signer_cls = MagicMock()
+    monkeypatch.setattr("emissor.services.xml_signer.XMLSigner", signer_cls)
+    return signer_cls.return_value
+
+
+@pytest.fixture
+def signed(mock_signer, self_signed_pem):
+    """Sign a template DPS with a signer that hands the same element back."""
+    key_pem, cert_pem = self_signed_pem
+    dps = _make_dps(_DPS_ID)
+    mock_signer.sign.return_value = dps
+    return sign_dps(dps, key_pem, cert_pem)
+
+
+def test_adds_signature(mock_signer, self_signed_pem):
+    key_pem, cert_pem = self_signed_pem
+    dps = _make_dps()
+    # Make mock signer return element with a Signature child
+    signed_el = etree.Element("DPS")
+    etree.SubElement(signed_el, "infDPS").set("Id", "DPS1")
+    etree.SubElement(signed_el, _SIGNATURE)
+    mock_signer.sign.return_value = signed_el
+
+    result = sign_dps(dps, key_pem, cert_pem)
+    sig = result.find(_SIGNATURE)
+    assert sig is not None
+
+
+def test_reference_uri_matches_id(mock_signer, signed, self_signed_pem):
+    key_pem, cert_pem = self_signed_pem
+    # The pass-through signer hands back the very DPS it was given
+    mock_signer.sign.assert_called_once_with(
+        signed,
+        key=key_pem,
+        cert=cert_pem.decode(),
+        reference_uri=_REFERENCE_URI,
+    )
+
+
+def test_preserves_content(signed):
+    # infDPS and tpAmb are first children in the template, so index them directly
+    inf = signed[0]
+    assert inf.tag == "infDPS"
+    tp_amb = inf[0]
+    assert tp_amb.tag == "tpAmb" and tp_amb.text == "2"
+
+
+def test_raises_no_inf_dps(self_signed_pem):
+    key_pem, cert_pem = self_signed_pem
+    with pytest.raises(ValueError) as exc_info:
+        sign_dps(_DPS_WITHOUT_INF, key_pem, cert_pem)
+    assert str(exc_info.value) == "infDPS element not found in DPS"
+
+
+def test_raises_no_id(self_signed_pem):
+    key_pem, cert_pem = self_signed_pem
+    with pytest.raises(ValueError) as exc_info:
+        sign_dps(_DPS_WITHOUT_ID, key_pem, cert_pem)
+    assert str(exc_info.value) == "infDPS is missing Id attribute"